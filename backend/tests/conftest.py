@@ -0,0 +1,18 @@
+"""
+Unit tests for main.py's pure components. Run from backend/: python -m pytest -q
+No Supabase, ytmusicapi calls or network: the disk tiers point at a temp dir
+and every test that needs a client brings its own fake.
+"""
+import os
+import sys
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="sori-tests-")
+os.environ["SUPABASE_URL"] = ""
+os.environ["SUPABASE_KEY"] = ""
+os.environ["LOCAL_CACHE_ENABLED"] = "false"
+os.environ["SNAPSHOT_ENABLED"] = "false"
+os.environ["SNAPSHOT_DIR"] = os.path.join(_TMP, "snapshots")
+os.environ["CHART_HISTORY_PATH"] = os.path.join(_TMP, "chart-history.sqlite3")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
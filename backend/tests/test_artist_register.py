@@ -0,0 +1,70 @@
+import pytest
+
+import main
+
+
+class FakeTable:
+    def __init__(self, client):
+        self.client = client
+
+    def upsert(self, rows, on_conflict):
+        self.rows = rows
+        return self
+
+    def execute(self):
+        if self.client.fail:
+            raise ConnectionError("supabase down")
+        self.client.upserts.append(self.rows)
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.upserts = []
+        self.fail = False
+
+    def table(self, name):
+        return FakeTable(self)
+
+
+@pytest.fixture
+def sb(monkeypatch):
+    client = FakeSupabase()
+    monkeypatch.setattr(main, "get_supabase", lambda: client)
+    monkeypatch.setattr(main, "_register_pending", {})
+    monkeypatch.setattr(main, "_register_written", {})
+    monkeypatch.setattr(main, "_register_last_queued", 0.0)
+    return client
+
+
+def _register(channel_id="UC1", name="IU"):
+    return main.register_artist(main.ArtistRegisterRequest(channel_id=channel_id, name=name))
+
+
+def test_idle_registration_is_written_before_responding(sb):
+    assert _register()["status"] == "registered"
+    assert [row["channel_id"] for row in sb.upserts[0]] == ["UC1"]
+    assert _register()["status"] == "unchanged"
+    assert len(sb.upserts) == 1
+
+
+def test_busy_registration_is_deferred_with_202(sb):
+    _register("UC1")
+    response = _register("UC2")
+    assert response.status_code == 202
+    assert b'"queued"' in response.body
+    assert list(main._register_pending) == ["UC2"]
+    assert main.flush_artist_registrations() == 1
+
+
+def test_failed_idle_write_stays_queued(sb):
+    sb.fail = True
+    assert _register().status_code == 202
+    assert "UC1" in main._register_pending
+
+
+def test_register_invalidates_registry_before_flush(sb, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(main.artist_registry, "invalidate", invalidated.append)
+    monkeypatch.setattr(main, "flush_artist_registrations", lambda: 0)
+    _register("UC9")
+    assert invalidated == ["UC9"]
@@ -0,0 +1,30 @@
+import threading
+import time
+
+import pytest
+
+import main
+from main import Bulkhead, BulkheadFullError
+
+
+def test_bulkhead_rejects_when_workers_and_queue_are_full():
+    bulkhead = Bulkhead("test", max_workers=1, max_queue=1)
+    release = threading.Event()
+    first = bulkhead.submit(release.wait, 2)
+    second = bulkhead.submit(release.wait, 2)
+    with pytest.raises(BulkheadFullError):
+        bulkhead.submit(release.wait, 2)
+    assert bulkhead.rejected == 1
+    assert bulkhead.inflight == 2
+
+    release.set()
+    first.result(2)
+    second.result(2)
+    time.sleep(0.05)  # done callbacks release the slots
+    assert bulkhead.inflight == 0
+    assert bulkhead.run(lambda: "ok", timeout=2) == "ok"
+
+
+def test_bulkhead_runs_at_its_priority():
+    bulkhead = Bulkhead("test-warm", max_workers=1, max_queue=0, priority=main.PRIORITY_WARM)
+    assert bulkhead.run(main.current_upstream_priority, timeout=2) == main.PRIORITY_WARM
@@ -0,0 +1,34 @@
+import time
+
+import main
+from main import make_cache_key
+
+
+def test_jittered_ttl_within_policy_bounds():
+    key = make_cache_key("charts", "US", "en")
+    jitter = main.cache_expiry_policy(key)[0]
+    ttls = {main.jittered_ttl(key, 1000) for _ in range(200)}
+    assert all(1000 * (1 - jitter) - 1 <= ttl <= 1000 for ttl in ttls)
+    assert len(ttls) > 1
+
+
+def test_jittered_ttl_leaves_nonpositive_ttl():
+    assert main.jittered_ttl(make_cache_key("charts", "US", "en"), 0) == 0
+
+
+def test_expires_early_never_far_from_expiry():
+    key = make_cache_key("home", 100, "US", "en")
+    now = time.time()
+    assert not any(main.expires_early(key, now + 3600, now) for _ in range(200))
+
+
+def test_expires_early_always_once_expired():
+    key = make_cache_key("home", 100, "US", "en")
+    now = time.time()
+    assert all(main.expires_early(key, now - 1, now) for _ in range(50))
+
+
+def test_expires_early_disabled_by_zero_beta():
+    key = make_cache_key("upstream_error", "album", "x")
+    now = time.time()
+    assert not any(main.expires_early(key, now - 1, now) for _ in range(50))
@@ -0,0 +1,30 @@
+import hashlib
+
+from main import CacheKey, make_cache_key
+
+
+def test_cache_key_is_frontend_md5():
+    key = make_cache_key("home", 100, "KR", "ko")
+    assert key == hashlib.md5(b"home:100:KR:ko").hexdigest()
+    assert isinstance(key, str)
+
+
+def test_cache_key_structured_parts():
+    key = make_cache_key("mood_playlists", "ggMPOg1", "US", "en")
+    assert (key.namespace, key.country, key.language, key.item_id) == ("mood_playlists", "US", "en", "ggMPOg1")
+    assert key.path == "mood_playlists/US/en/ggMPOg1"
+    assert key.columns()["key_path"] == key.path
+
+
+def test_cache_key_without_locale_or_item():
+    key = make_cache_key("charts", "US", "en")
+    assert key.item_id is None
+    assert key.path == "charts/US/en/-"
+    album = make_cache_key("album", "MPREb_1")
+    assert album.path == "album/-/-/MPREb_1"
+
+
+def test_cache_key_unknown_namespace_keeps_parts_as_item():
+    key = CacheKey("custom", "a", 2)
+    assert key.item_id == "a:2"
+    assert key.country is None
@@ -0,0 +1,25 @@
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+@pytest.fixture
+def history(monkeypatch, tmp_path):
+    history = main.ChartHistory(str(tmp_path / "history.sqlite3"))
+    monkeypatch.setattr(main, "get_supabase", lambda: None)
+    monkeypatch.setattr(main, "chart_history", history)
+    history.append("US", {"strings": ["Song"], "lists": {"songs": {"ids": ["v1"], "titles": [0]}}})
+    return history
+
+
+@pytest.mark.parametrize("since", ["inf", "-inf", "nan", "1e300", "-1", "0001-01-01T00:00:00"])
+def test_charts_diff_rejects_out_of_range_since(history, since):
+    with pytest.raises(HTTPException) as e:
+        main.get_charts_diff("US", since)
+    assert e.value.status_code == 400
+
+
+def test_charts_diff_accepts_unix_and_iso_since(history):
+    assert main.get_charts_diff("US", "0")["lists"]["songs"]["new"] == []
+    assert main.get_charts_diff("US", "2026-01-01T00:00:00Z")["country"] == "US"
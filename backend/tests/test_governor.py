@@ -0,0 +1,40 @@
+import time
+
+import pytest
+
+import main
+from main import TokenBucket
+
+
+def test_token_bucket_starts_full():
+    bucket = TokenBucket(rate=1.0, capacity=5)
+    assert bucket.wait_time() == 0.0
+    bucket.tokens -= 5
+    assert bucket.wait_time() == pytest.approx(1.0, abs=0.05)
+
+
+def test_token_bucket_refill_capped_at_capacity():
+    bucket = TokenBucket(rate=1000.0, capacity=3)
+    bucket.tokens = 0
+    time.sleep(0.02)
+    bucket.refill()
+    assert bucket.tokens == 3
+
+
+def test_token_bucket_reserve_delays_background_callers():
+    bucket = TokenBucket(rate=10.0, capacity=10)
+    bucket.tokens = 2
+    assert bucket.wait_time() == 0.0
+    assert bucket.wait_time(reserve=3) > 0
+
+
+def test_overdue_user_request_overdraws_buckets(monkeypatch):
+    monkeypatch.setattr(main, "UPSTREAM_RATE_PER_COUNTRY", 0.01)
+    monkeypatch.setattr(main, "UPSTREAM_BURST_PER_COUNTRY", 1)
+    monkeypatch.setattr(main, "UPSTREAM_USER_MAX_WAIT", 0.05)
+    governor = main.UpstreamGovernor([])
+    governor.acquire("US", main.DIRECT_PROXY_ID, main.PRIORITY_USER)
+    governor.acquire("US", main.DIRECT_PROXY_ID, main.PRIORITY_USER)  # past the wait, still debited
+    bucket = governor.country_buckets["US"]
+    assert bucket.tokens < 0
+    assert bucket.wait_time(bucket.capacity * main.UPSTREAM_USER_RESERVE) > 1
@@ -0,0 +1,10 @@
+import re
+
+import main
+
+
+def test_like_escape_round_trips_through_regex():
+    pattern = main.like_escape("mood_playlists/") + "%"
+    rx = re.compile(main.like_to_regex(pattern))
+    assert rx.fullmatch("mood_playlists/US/en/x")
+    assert not rx.fullmatch("moodXplaylists/US/en/x")
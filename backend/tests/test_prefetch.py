@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+
+import main
+from main import CountMinSketch, prefetch_target
+
+
+# ---- CountMinSketch ----
+
+def test_count_min_never_underestimates():
+    sketch = CountMinSketch(width=64, depth=4)
+    truth = {}
+    for i in range(500):
+        item = f"album/{i % 37}"
+        truth[item] = truth.get(item, 0) + 1
+        sketch.add(item)
+    assert all(sketch.estimate(item) >= count for item, count in truth.items())
+
+
+def test_count_min_add_returns_estimate():
+    sketch = CountMinSketch()
+    assert sketch.add("artist/x") == 1
+    assert sketch.add("artist/x") == 2
+    assert sketch.estimate("artist/unseen") == 0
+
+
+def test_count_min_halves_counters_on_decay():
+    sketch = CountMinSketch(width=256, depth=3, decay_every=10)
+    for _ in range(9):
+        sketch.add("hot")
+    assert sketch.estimate("hot") == 9
+    sketch.add("hot")
+    assert sketch.estimate("hot") == 5
+    assert sketch.added == 0
+
+
+# ---- Route parsing ----
+
+def test_prefetch_target_routes():
+    assert prefetch_target("/album/{browse_id}", {"browse_id": "MPREb_1"}, {}) == ("album", "MPREb_1", None, None)
+    assert prefetch_target("/artist/{artist_id}", {"artist_id": "UC1"}, {"country": "KR"}) == ("artist", "UC1", "KR", "en")
+    assert prefetch_target("/watch", {}, {"playlistId": "RD1"}) == ("watch", "RD1", None, None)
+    assert prefetch_target("/charts", {}, {}) is None
+
+
+def test_prefetch_ignores_playlist_tracks_route():
+    assert prefetch_target("/playlist/tracks", {}, {"playlist_id": "PL1"}) is None
+    assert prefetch_target("/artist/{artist_id}/songs", {"artist_id": "UC1"}, {}) is None
+
+
+def test_navigation_middleware_uses_route_templates(monkeypatch):
+    observed = []
+    monkeypatch.setattr(main, "PREFETCH_ENABLED", True)
+    monkeypatch.setattr(main.prefetcher, "observe", lambda client, target: observed.append(target) or [])
+    monkeypatch.setattr(main, "cache_get", lambda key: {"cached": True})
+    client = TestClient(main.app)
+    assert client.get("/playlist/tracks", params={"playlistId": "PL1"}).status_code == 200
+    assert client.get("/album/MPREb_1").status_code == 200
+    assert observed == [("album", "MPREb_1", None, None)]
+
+
+def test_background_loads_are_not_demand(monkeypatch):
+    monkeypatch.setattr(main, "_cache_accessed_keys", set())
+    with main.upstream_priority(main.PRIORITY_WARM):
+        main.record_cache_access("k")
+        main.refresh_scheduler.record("home", "ZZ", "xx")
+    main.record_cache_access("user-key")
+    assert main._cache_accessed_keys == {"user-key"}
+    assert ("home", "ZZ", "xx", None) not in main.refresh_scheduler._demand
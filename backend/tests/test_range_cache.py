@@ -0,0 +1,41 @@
+import pytest
+
+import main
+
+
+class FakeYT:
+    def __init__(self, tracks: int = 250):
+        self.tracks = tracks
+
+    def get_album(self, browse_id):
+        return {"title": "Album", "tracks": [{"videoId": str(i), "duration_seconds": 1} for i in range(30)]}
+
+    def get_playlist(self, playlist_id, limit):
+        return {"id": playlist_id, "tracks": [{"videoId": str(i)} for i in range(min(limit, self.tracks))]}
+
+
+@pytest.fixture
+def yt(monkeypatch):
+    fake = FakeYT()
+    monkeypatch.setattr(main, "get_supabase", lambda: None)
+    monkeypatch.setattr(main, "get_ytmusic", lambda **kwargs: fake)
+    return fake
+
+
+def test_album_ids_return_the_whole_album(yt):
+    result = main.get_playlist("OLAK5uy_abc", limit=5)
+    assert len(result["tracks"]) == 30
+
+
+def test_range_without_send_request_hook_is_not_marked_complete(yt):
+    entry = main.fetch_playlist_range(yt, "PL1", 100)
+    assert entry == {"result": entry["result"], "token": None, "complete": False}
+    assert not main.range_covers(entry, 101)
+    assert main.range_covers(entry, 100)
+
+
+def test_short_result_without_hook_is_complete(yt):
+    yt.tracks = 40
+    entry = main.fetch_playlist_range(yt, "PL1", 100)
+    assert entry["complete"]
+    assert main.range_covers(entry, 500)
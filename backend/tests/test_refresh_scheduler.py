@@ -0,0 +1,41 @@
+import pytest
+
+import main
+from main import RefreshScheduler
+
+
+@pytest.fixture
+def scheduler():
+    return RefreshScheduler(per_hour=3600, ahead=60, half_life=3600, max_targets=100)
+
+
+def test_record_only_counts_warmed_countries_and_supported_languages(scheduler):
+    scheduler.record("home", "KR", "ko")
+    scheduler.record("home", "XX", "ko")
+    scheduler.record("home", "KR", "klingon")
+    scheduler.record("charts", "US" * 500, "en")
+    assert list(scheduler._demand) == [("home", "KR", "ko", None)]
+
+
+def test_charts_refresh_costs_each_chart_playlist():
+    assert main.refresh_cost("charts", "US") == 3
+    assert main.refresh_cost("home", "US") == 1
+
+
+class _Stop(Exception):
+    pass
+
+
+def test_scheduler_sleeps_for_the_refresh_cost(scheduler, monkeypatch):
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        raise _Stop
+
+    monkeypatch.setattr(scheduler, "next_due", lambda: ("charts", "US", "en", None))
+    monkeypatch.setattr(scheduler, "refresh", lambda target: True)
+    monkeypatch.setattr(main.time, "sleep", sleep)
+    with pytest.raises(_Stop):
+        scheduler.run_forever()
+    assert slept[0] == pytest.approx(3 * scheduler.interval, abs=0.1)
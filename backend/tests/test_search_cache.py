@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+from main import PopularityCache, SingleFlight
+
+
+# ---- SingleFlight ----
+
+def test_single_flight_shares_one_execution():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def load():
+        calls.append(1)
+        release.wait(2)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", load))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2)
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_single_flight_propagates_errors_and_forgets_key():
+    flight = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 42) == 42
+
+
+# ---- PopularityCache ----
+
+def test_popularity_cache_hit_and_miss():
+    cache = PopularityCache(max_entries=10, base_ttl=60, max_ttl=600)
+    assert cache.hit("iu") is None
+    cache.set("iu", ["result"])
+    assert cache.hit("iu") == ["result"]
+    assert cache.hits("iu") == 2
+
+
+def test_popularity_cache_expired_entry_misses_but_keeps_hits():
+    cache = PopularityCache(max_entries=10, base_ttl=60, max_ttl=600)
+    cache.hit("iu")
+    cache.set("iu", ["result"], ttl=-1)
+    assert cache.hit("iu") is None
+    assert cache.hits("iu") == 2
+
+
+def test_popularity_cache_ttl_grows_with_hits_up_to_max():
+    cache = PopularityCache(max_entries=10, base_ttl=60, max_ttl=200)
+    cache.hit("q")
+    assert cache.ttl_for("q") == 60
+    for _ in range(3):
+        cache.hit("q")
+    assert cache.ttl_for("q") == 180   # 4 hits -> bit_length 3
+    for _ in range(100):
+        cache.hit("q")
+    assert cache.ttl_for("q") == 200
+
+
+def test_popularity_cache_evicts_least_popular():
+    cache = PopularityCache(max_entries=2, base_ttl=60, max_ttl=600)
+    for _ in range(3):
+        cache.hit("popular")
+    cache.set("popular", 1)
+    cache.set("rare", 2)
+    cache.set("new", 3)
+    assert len(cache) == 2
+    assert cache.hit("popular") == 1
+    assert cache.hits("rare") == 0
@@ -0,0 +1,37 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import main
+
+
+def test_cursor_round_trip():
+    state = {"t": "token", "q": "iu", "f": None, "p": 3}
+    assert main.decode_search_cursor(main.encode_search_cursor(state)) == state
+
+
+@pytest.mark.parametrize("state", [
+    {"q": "iu"},
+    {"t": 1, "q": "iu"},
+    {"t": "x", "q": "iu", "p": "a"},
+    {"t": "x", "q": "iu", "p": None},
+    {"t": "x", "q": "iu", "p": 1.5},
+    {"t": "x", "q": "iu", "p": 0},
+    ["t"],
+])
+def test_malformed_cursor_is_400(state):
+    with pytest.raises(HTTPException) as e:
+        main.decode_search_cursor(main.encode_search_cursor(state))
+    assert e.value.status_code == 400
+
+
+def test_garbage_cursor_is_400():
+    with pytest.raises(HTTPException) as e:
+        main.decode_search_cursor("not base64!")
+    assert e.value.status_code == 400
+
+
+def test_search_page_rejects_crafted_page_number():
+    cursor = main.encode_search_cursor({"t": "x", "q": "iu", "f": None, "p": "a"})
+    response = TestClient(main.app).get("/search/page", params={"q": "iu", "cursor": cursor})
+    assert response.status_code == 400
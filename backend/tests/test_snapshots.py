@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+import main
+from main import SnapshotStore, build_snapshot_bundle, make_cache_key
+
+
+@pytest.fixture
+def snapshot_store(tmp_path, monkeypatch):
+    store = SnapshotStore(str(tmp_path))
+    monkeypatch.setattr(main, "snapshot_store", store)
+    monkeypatch.setattr(main, "get_supabase", lambda: None)
+    return store
+
+
+def _write_bundle(store, entries):
+    bundle, _ = build_snapshot_bundle("US", "en", entries)
+    with open(f"{store.directory}/US_en.bundle", "wb") as f:
+        f.write(bundle)
+    assert store.load_local() == 1
+
+
+def test_snapshot_serves_source_expiry(snapshot_store):
+    charts = make_cache_key("charts", "US", "en")
+    moods = make_cache_key("moods", "US", "en")
+    expires_at = time.time() + 3600
+    _write_bundle(snapshot_store, {charts: ({"a": 1}, expires_at), moods: ([1], time.time() - 1)})
+    assert main.cache_get_entry(charts) == ({"a": 1}, pytest.approx(expires_at))
+    assert main.cache_get(moods) is None
+
+
+def test_snapshot_expiry_capped(snapshot_store):
+    charts = make_cache_key("charts", "US", "en")
+    _write_bundle(snapshot_store, {charts: ({"a": 1}, time.time() + 10 * main.SNAPSHOT_MAX_AGE)})
+    assert snapshot_store.get_entry(charts)[1] <= time.time() + main.SNAPSHOT_MAX_AGE
+
+
+def test_snapshot_entry_dropped_on_write_and_invalidate(snapshot_store):
+    charts = make_cache_key("charts", "US", "en")
+    us_moods = make_cache_key("moods", "US", "en")
+    kr_moods = make_cache_key("moods", "KR", "en")
+    later = time.time() + 3600
+    _write_bundle(snapshot_store, {charts: ({}, later), us_moods: ({}, later), kr_moods: ({}, later)})
+
+    main.cache_set(charts, {"fresh": True}, 60)
+    assert snapshot_store.get_bytes(charts) is None
+
+    main.cache_invalidate(country="KR")
+    assert snapshot_store.get_bytes(kr_moods) is None
+    assert snapshot_store.get_bytes(us_moods) is not None
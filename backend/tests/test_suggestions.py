@@ -0,0 +1,71 @@
+import main
+from main import SuggestionIndex
+
+
+def test_suggestions_unseen_prefix_asks_upstream():
+    index = SuggestionIndex(max_terms=100)
+    index.add("IU", main.WEIGHT_ARTIST)
+    assert index.lookup("i") is None
+
+
+def test_suggestions_seen_prefix_served_by_weight():
+    index = SuggestionIndex(max_terms=100)
+    index.add("Blueming", main.WEIGHT_TITLE)
+    index.add("BLACKPINK", main.WEIGHT_ARTIST)
+    index.add_upstream("bl", ["Blue Valentine", "blackpink"])
+    result = index.lookup("bl")
+    assert result[0] == "Blue Valentine"
+    assert result.index("BLACKPINK") < result.index("Blueming")
+    assert index.lookup("xyz") is None
+
+
+def test_suggestions_enough_local_matches_skip_upstream():
+    index = SuggestionIndex(max_terms=100)
+    for i in range(3):
+        index.add(f"song {i}", main.WEIGHT_TITLE)
+    assert index.lookup("song", limit=3) is not None
+    assert index.lookup("song", limit=4) is None
+
+
+def test_suggestions_respect_max_terms_and_normalize():
+    index = SuggestionIndex(max_terms=2)
+    index.add("  New  Jeans ", 1.0)
+    index.add("new jeans", 1.0)       # same normalized term
+    index.add("aespa", 1.0)
+    index.add("ive", 1.0)             # over the cap
+    assert len(index) == 2
+
+
+def test_suggestions_index_payload_titles_once():
+    index = SuggestionIndex(max_terms=100)
+    home = [{"title": "Quick picks", "contents": [{"title": "Hype Boy", "artists": [{"name": "NewJeans"}]}]}]
+    index.add_payload_titles("home-key", home)
+    index.add_payload_titles("home-key", home)
+    assert len(index) == 2
+    index.add_upstream("hype", [])
+    assert index.lookup("hype") == ["Hype Boy"]
+
+
+def test_suggestions_saturated_index_still_asks_upstream_for_new_prefix():
+    index = SuggestionIndex(max_terms=3)
+    for title in ("alpha", "beta", "gamma"):
+        index.add(title, main.WEIGHT_TITLE)
+    index.add_upstream("zi", ["zico", "zion.t"])        # heavier: evicts two titles
+    assert index.lookup("zi") == ["zico", "zion.t"]
+    assert len(index) == 3
+
+    for name in ("k1", "k2", "k3"):
+        index.add(name, main.WEIGHT_UPSTREAM + 5)       # full of terms heavier than upstream
+    index.add_upstream("yo", ["yoasobi"])
+    assert index.lookup("yo") is None                   # not stored, so not marked seen
+
+
+def test_suggestions_wide_prefix_ranks_whole_range(monkeypatch):
+    monkeypatch.setattr(main, "SUGGESTION_SCAN_LIMIT", 5)
+    index = SuggestionIndex(max_terms=100)
+    for i in range(20):
+        index.add(f"song {i:02d}", main.WEIGHT_TITLE)
+    index.add("song zz", main.WEIGHT_ARTIST)            # sorts last, weighs most
+    assert index.lookup("song", limit=3)[0] == "song zz"
+    index.add("song zzz", main.WEIGHT_UPSTREAM)         # invalidates the cached ranking
+    assert index.lookup("song", limit=3)[:2] == ["song zzz", "song zz"]
@@ -0,0 +1,175 @@
+"""
+Warming leader lease and country sharding.
+The lease tests run the warm_leases migration against a throwaway Postgres:
+    TEST_DATABASE_URL=postgresql://postgres@localhost/sori_test python -m pytest -q
+and are skipped when it (or psycopg) is not available.
+"""
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import main
+from main import WarmCoordinator
+
+MIGRATION = Path(__file__).resolve().parents[2] / "supabase" / "migrations" / "20260111070000_warm_leases.sql"
+
+
+class _Result:
+    def __init__(self, data):
+        self.data = data
+
+
+class _Call:
+    def __init__(self, func):
+        self.func = func
+
+    def execute(self):
+        return _Result(self.func())
+
+
+class PgRpc:
+    """The slice of the Supabase client WarmCoordinator uses for the lease: rpc(...).execute().data"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def rpc(self, name: str, params: dict):
+        args = ", ".join(f"{param} => %({param})s" for param in params)
+
+        def call():
+            return self.conn.execute(f"SELECT public.{name}({args})", params).fetchone()[0]
+        return _Call(call)
+
+
+@pytest.fixture
+def pg():
+    psycopg = pytest.importorskip("psycopg")
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL not set")
+    conn = psycopg.connect(url, autocommit=True)
+    conn.execute(MIGRATION.read_text())
+    conn.execute("TRUNCATE public.warm_leases")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def lease_pair(pg, monkeypatch):
+    client = PgRpc(pg)
+    monkeypatch.setattr(main, "get_supabase", lambda: client)
+    return WarmCoordinator("test_lease", 30, False), WarmCoordinator("test_lease", 30, False)
+
+
+def _lease_row(pg):
+    return pg.execute(
+        "SELECT holder, expires_at, acquired_at FROM public.warm_leases WHERE name = 'test_lease'"
+    ).fetchone()
+
+
+# ---- Lease functions (Postgres) ----
+
+def test_lease_acquire_is_exclusive(pg, lease_pair):
+    first, second = lease_pair
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert _lease_row(pg)[0] == first.instance_id
+
+
+def test_lease_renew_extends_expiry_keeps_acquired_at(pg, lease_pair):
+    first, _ = lease_pair
+    assert first.try_acquire()
+    _, expires_before, acquired_before = _lease_row(pg)
+    time.sleep(0.01)
+    assert first.try_acquire()
+    holder, expires_after, acquired_after = _lease_row(pg)
+    assert holder == first.instance_id
+    assert expires_after > expires_before
+    assert acquired_after == acquired_before
+
+
+def test_lease_taken_over_after_expiry(pg, lease_pair):
+    first, second = lease_pair
+    assert first.try_acquire()
+    pg.execute("UPDATE public.warm_leases SET expires_at = NOW() - INTERVAL '1 second' WHERE name = 'test_lease'")
+    assert second.try_acquire()
+    assert _lease_row(pg)[0] == second.instance_id
+    assert not first.try_acquire()
+
+
+def test_lease_release_only_by_holder(pg, lease_pair):
+    first, second = lease_pair
+    first.heartbeat()
+    assert first.is_leader
+    client = main.get_supabase()
+    assert not client.rpc("release_warm_lease", {"p_name": "test_lease", "p_holder": second.instance_id}).execute().data
+    assert _lease_row(pg)[0] == first.instance_id
+    first.release()
+    assert _lease_row(pg) is None
+    assert not first.is_leader
+    assert second.try_acquire()
+
+
+# ---- Heartbeat transitions (fake RPC) ----
+
+class FakeLease:
+    def __init__(self):
+        self.grant = True
+        self.fail = False
+
+    def rpc(self, name, params):
+        def call():
+            if self.fail:
+                raise ConnectionError("supabase down")
+            return self.grant
+        return _Call(call)
+
+
+def test_heartbeat_elects_and_steps_down(monkeypatch):
+    lease = FakeLease()
+    monkeypatch.setattr(main, "get_supabase", lambda: lease)
+    job = main.WarmJob(["US"], "en", "country")
+    monkeypatch.setattr(main, "warm_jobs", {job.id: job})
+    coordinator = WarmCoordinator("test_lease", 30, False)
+
+    coordinator.heartbeat()
+    assert coordinator.is_leader and coordinator.stats["elected"] == 1
+
+    lease.fail = True
+    coordinator.heartbeat()
+    assert not coordinator.is_leader
+    assert coordinator.stats["lost"] == 1 and coordinator.stats["errors"] == 1
+    assert job._cancel.is_set() and job._cancel_status == "interrupted"
+
+
+def test_without_supabase_single_instance_leads(monkeypatch):
+    monkeypatch.setattr(main, "get_supabase", lambda: None)
+    coordinator = WarmCoordinator("test_lease", 30, False)
+    coordinator.heartbeat()
+    assert coordinator.is_leader
+    assert coordinator.shard(["US", "KR"]) == ["US", "KR"]
+
+
+# ---- Country sharding ----
+
+def test_shards_partition_countries():
+    members = sorted(f"instance-{i}" for i in range(3))
+    shards = []
+    for instance_id in members:
+        coordinator = WarmCoordinator("test_lease", 30, True)
+        coordinator.instance_id = instance_id
+        coordinator.members = members
+        shards.append(coordinator.shard(main.ALL_COUNTRIES))
+    assigned = [country for shard in shards for country in shard]
+    assert sorted(assigned) == sorted(main.ALL_COUNTRIES)
+    assert all(shards)
+
+
+def test_shard_assignment_is_stable_per_member_list():
+    coordinator = WarmCoordinator("test_lease", 30, True)
+    coordinator.members = sorted([coordinator.instance_id, "other"])
+    assert coordinator.shard(main.ALL_COUNTRIES) == coordinator.shard(main.ALL_COUNTRIES)
+    coordinator.members = [coordinator.instance_id]
+    assert coordinator.shard(main.ALL_COUNTRIES) == list(main.ALL_COUNTRIES)
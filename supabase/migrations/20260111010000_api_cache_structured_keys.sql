@@ -0,0 +1,46 @@
+-- ============================================
+-- api_cache: Structured Keys + Catalog
+-- key stays the md5 hash (frontend reads it directly);
+-- the backend now also writes the parts it was hashed from
+-- so status, coverage and invalidation no longer scan the table.
+-- ============================================
+
+-- 1. Structured key columns
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS namespace TEXT;
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS country TEXT;
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS language TEXT;
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS item_id TEXT;
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS key_path TEXT;  -- namespace/country/language/item_id
+
+-- 2. Indexes
+CREATE INDEX IF NOT EXISTS idx_api_cache_namespace_country_language
+  ON public.api_cache(namespace, country, language);
+
+-- text_pattern_ops so LIKE 'home/KR/%' can use the index
+CREATE INDEX IF NOT EXISTS idx_api_cache_key_path
+  ON public.api_cache(key_path text_pattern_ops);
+
+-- 3. Catalog aggregate (used by /cache/status and /cache/countries)
+-- Rows written before this migration have NULL namespace until they are refreshed.
+CREATE OR REPLACE FUNCTION public.api_cache_catalog()
+RETURNS TABLE (
+  namespace TEXT,
+  country TEXT,
+  language TEXT,
+  entries BIGINT,
+  expired BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  SELECT
+    c.namespace,
+    c.country,
+    c.language,
+    COUNT(*) AS entries,
+    COUNT(*) FILTER (WHERE c.expires_at <= NOW()) AS expired
+  FROM public.api_cache c
+  GROUP BY c.namespace, c.country, c.language;
+$$;
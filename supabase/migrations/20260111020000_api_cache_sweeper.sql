@@ -0,0 +1,47 @@
+-- ============================================
+-- api_cache: Sweeper + Namespace Quotas
+-- Expired rows are deleted in batches by the backend sweeper,
+-- and namespaces over quota evict least recently accessed rows.
+-- ============================================
+
+-- 1. Access tracking (flushed in batches by the backend)
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS last_accessed_at TIMESTAMPTZ DEFAULT NOW();
+
+-- 2. Indexes for the sweeper and LRU eviction
+CREATE INDEX IF NOT EXISTS idx_api_cache_expires_at
+  ON public.api_cache(expires_at);
+
+CREATE INDEX IF NOT EXISTS idx_api_cache_namespace_accessed
+  ON public.api_cache(namespace, last_accessed_at NULLS FIRST);
+
+-- 3. Batch touch
+CREATE OR REPLACE FUNCTION public.api_cache_touch(p_keys TEXT[])
+RETURNS VOID
+LANGUAGE sql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  UPDATE public.api_cache
+  SET last_accessed_at = NOW()
+  WHERE key = ANY(p_keys);
+$$;
+
+-- 4. Size per namespace (for /cache/metrics and quota checks)
+CREATE OR REPLACE FUNCTION public.api_cache_namespace_sizes()
+RETURNS TABLE (
+  namespace TEXT,
+  entries BIGINT,
+  bytes BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  SELECT
+    c.namespace,
+    COUNT(*) AS entries,
+    COALESCE(SUM(pg_column_size(c.data)), 0)::BIGINT AS bytes
+  FROM public.api_cache c
+  GROUP BY c.namespace;
+$$;
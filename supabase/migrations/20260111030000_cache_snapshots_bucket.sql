@@ -0,0 +1,10 @@
+-- ============================================
+-- Cache Snapshot Bundles (Storage)
+-- Per (country, language) bundles of home/charts/moods written by the
+-- backend warmer and read by new instances at startup.
+-- Private bucket: only the service role (backend) reads and writes it.
+-- ============================================
+
+INSERT INTO storage.buckets (id, name, public)
+VALUES ('cache-snapshots', 'cache-snapshots', false)
+ON CONFLICT (id) DO NOTHING;
@@ -0,0 +1,32 @@
+-- ============================================
+-- AI Jobs (AI 게시글 생성 작업 큐)
+-- Gemini generation runs as background jobs on the backend's ai worker pool.
+-- Requests get the fallback post immediately and poll the job by id.
+-- ============================================
+
+-- 1. ai_jobs 테이블 생성
+CREATE TABLE IF NOT EXISTS public.ai_jobs (
+  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  kind TEXT NOT NULL,                 -- artist_post, welcome
+  dedup_key TEXT NOT NULL,            -- welcome:<artist_id>, post:<prompt key>
+  payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+  status TEXT NOT NULL DEFAULT 'pending',  -- pending, running, done, failed
+  result TEXT,
+  error TEXT,
+
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 2. 같은 dedup_key로 진행 중인 작업은 하나만 (인스턴스 간 중복 생성 방지)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_ai_jobs_active_dedup
+  ON public.ai_jobs(dedup_key)
+  WHERE status IN ('pending', 'running');
+
+-- 3. Stale job resume scan
+CREATE INDEX IF NOT EXISTS idx_ai_jobs_status_updated
+  ON public.ai_jobs(status, updated_at);
+
+-- 4. RLS 활성화 (service role only - no public policies)
+ALTER TABLE public.ai_jobs ENABLE ROW LEVEL SECURITY;
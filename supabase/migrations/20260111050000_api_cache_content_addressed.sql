@@ -0,0 +1,67 @@
+-- ============================================
+-- api_cache: Content-Addressed Payloads
+-- Rows carry a content hash so an unchanged refresh only extends expires_at.
+-- Namespaces the frontend doesn't read directly store their body once per
+-- hash in api_cache_blobs and leave api_cache.data NULL.
+-- ============================================
+
+-- 1. Payload bodies, one row per content hash
+CREATE TABLE IF NOT EXISTS public.api_cache_blobs (
+  hash TEXT PRIMARY KEY,              -- sha256 of canonical JSON
+  data JSONB NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+ALTER TABLE public.api_cache_blobs ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Service role can manage api_cache_blobs" ON public.api_cache_blobs;
+CREATE POLICY "Service role can manage api_cache_blobs"
+  ON public.api_cache_blobs FOR ALL
+  USING ((SELECT auth.role()) = 'service_role');
+
+-- 2. Hash columns on api_cache (blob_hash set only when data lives in api_cache_blobs)
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE public.api_cache ADD COLUMN IF NOT EXISTS blob_hash TEXT
+  REFERENCES public.api_cache_blobs(hash);
+ALTER TABLE public.api_cache ALTER COLUMN data DROP NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_api_cache_blob_hash
+  ON public.api_cache(blob_hash)
+  WHERE blob_hash IS NOT NULL;
+
+-- 3. Orphaned blob cleanup (called by the backend sweeper)
+CREATE OR REPLACE FUNCTION public.api_cache_blobs_gc()
+RETURNS INTEGER
+LANGUAGE sql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  WITH deleted AS (
+    DELETE FROM public.api_cache_blobs b
+    WHERE b.created_at < NOW() - INTERVAL '1 hour'  -- don't race a write in progress
+      AND NOT EXISTS (SELECT 1 FROM public.api_cache c WHERE c.blob_hash = b.hash)
+    RETURNING 1
+  )
+  SELECT COUNT(*)::INTEGER FROM deleted;
+$$;
+
+-- 4. Namespace sizes include blob-backed bytes (logical size per row)
+CREATE OR REPLACE FUNCTION public.api_cache_namespace_sizes()
+RETURNS TABLE (
+  namespace TEXT,
+  entries BIGINT,
+  bytes BIGINT
+)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  SELECT
+    c.namespace,
+    COUNT(*) AS entries,
+    (COALESCE(SUM(pg_column_size(c.data)), 0) + COALESCE(SUM(pg_column_size(b.data)), 0))::BIGINT AS bytes
+  FROM public.api_cache c
+  LEFT JOIN public.api_cache_blobs b ON b.hash = c.blob_hash
+  GROUP BY c.namespace;
+$$;
@@ -0,0 +1,44 @@
+-- ============================================
+-- Warm Passes + Checkpoints (캐시 워밍 진행 상황 저장)
+-- Each warming pass records per (country, stage, item) progress so a pass
+-- interrupted by a restart resumes where it stopped and only retries the
+-- items that failed. Written by the backend (web process or `python main.py warm`).
+-- ============================================
+
+-- 1. warm_passes 테이블 생성
+CREATE TABLE IF NOT EXISTS public.warm_passes (
+  id TEXT PRIMARY KEY,
+  kind TEXT NOT NULL,                 -- all, country
+  language TEXT NOT NULL,
+  countries TEXT[] NOT NULL,
+
+  status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, done, failed, cancelled
+  error TEXT,
+
+  created_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+  finished_at TIMESTAMPTZ
+);
+
+-- 2. warm_checkpoints 테이블 생성 (item = cache item id, '-' for single-entry stages)
+CREATE TABLE IF NOT EXISTS public.warm_checkpoints (
+  pass_id TEXT NOT NULL REFERENCES public.warm_passes(id) ON DELETE CASCADE,
+  country TEXT NOT NULL,
+  stage TEXT NOT NULL,                -- charts, chart_playlists, ..., snapshot, country
+  item TEXT NOT NULL,
+
+  status TEXT NOT NULL,               -- done, failed
+  attempts INTEGER NOT NULL DEFAULT 1,
+  error TEXT,
+  updated_at TIMESTAMPTZ DEFAULT NOW(),
+
+  PRIMARY KEY (pass_id, country, stage, item)
+);
+
+-- 3. Resume scan: latest unfinished pass
+CREATE INDEX IF NOT EXISTS idx_warm_passes_status_created
+  ON public.warm_passes(status, created_at DESC);
+
+-- 4. RLS 활성화 (service role only - no public policies)
+ALTER TABLE public.warm_passes ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.warm_checkpoints ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,67 @@
+-- ============================================
+-- Warm Leases + Members (캐시 워밍 리더 선출)
+-- Only the instance holding the "cache_warming" lease runs full warming
+-- passes and the refresh scheduler. The holder renews the lease on a
+-- heartbeat; if it dies the lease expires and another instance takes over.
+-- With WARM_SHARDING the instances instead split countries using the
+-- warm_members heartbeat table.
+-- ============================================
+
+-- 1. warm_leases 테이블 생성
+CREATE TABLE IF NOT EXISTS public.warm_leases (
+  name TEXT PRIMARY KEY,
+  holder TEXT NOT NULL,
+  expires_at TIMESTAMPTZ NOT NULL,
+  acquired_at TIMESTAMPTZ DEFAULT NOW(),
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 2. warm_members 테이블 생성 (live instances for country sharding)
+CREATE TABLE IF NOT EXISTS public.warm_members (
+  instance_id TEXT PRIMARY KEY,
+  heartbeat_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_warm_members_heartbeat
+  ON public.warm_members(heartbeat_at);
+
+-- 3. Acquire or renew: succeeds if the lease is free, expired, or already ours.
+--    One statement, so two instances can never both get it.
+CREATE OR REPLACE FUNCTION public.try_acquire_warm_lease(p_name TEXT, p_holder TEXT, p_ttl_seconds INTEGER)
+RETURNS BOOLEAN
+LANGUAGE sql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  WITH acquired AS (
+    INSERT INTO public.warm_leases AS l (name, holder, expires_at, acquired_at, updated_at)
+    VALUES (p_name, p_holder, NOW() + make_interval(secs => p_ttl_seconds), NOW(), NOW())
+    ON CONFLICT (name) DO UPDATE
+      SET holder = EXCLUDED.holder,
+          expires_at = EXCLUDED.expires_at,
+          acquired_at = CASE WHEN l.holder = EXCLUDED.holder THEN l.acquired_at ELSE NOW() END,
+          updated_at = NOW()
+      WHERE l.holder = EXCLUDED.holder OR l.expires_at < NOW()
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM acquired);
+$$;
+
+-- 4. Release on shutdown (only by the current holder)
+CREATE OR REPLACE FUNCTION public.release_warm_lease(p_name TEXT, p_holder TEXT)
+RETURNS BOOLEAN
+LANGUAGE sql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+  WITH released AS (
+    DELETE FROM public.warm_leases
+    WHERE name = p_name AND holder = p_holder
+    RETURNING 1
+  )
+  SELECT EXISTS (SELECT 1 FROM released);
+$$;
+
+-- 5. RLS 활성화 (service role only - no public policies)
+ALTER TABLE public.warm_leases ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.warm_members ENABLE ROW LEVEL SECURITY;
@@ -0,0 +1,19 @@
+-- ============================================
+-- Chart Snapshots (차트 히스토리 공유 저장소)
+-- One columnar snapshot per country each time the charts change, written by
+-- whichever instance warmed or refreshed them. /charts/diff reads from here so
+-- every instance answers with the same history.
+-- ============================================
+
+-- 1. chart_snapshots 테이블 생성
+CREATE TABLE IF NOT EXISTS public.chart_snapshots (
+  country TEXT NOT NULL,
+  taken_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  digest TEXT NOT NULL,               -- sha256 of the snapshot JSON, skips unchanged charts
+  data JSONB NOT NULL,                -- {"strings": [...], "lists": {name: {"ids", "titles", "artists"}}}
+
+  PRIMARY KEY (country, taken_at)
+);
+
+-- 2. RLS 활성화 (service role only - no public policies)
+ALTER TABLE public.chart_snapshots ENABLE ROW LEVEL SECURITY;